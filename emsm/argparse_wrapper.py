@@ -25,12 +25,13 @@
 
 # Modules
 # ------------------------------------------------
+import sys
 import argparse
 
 
 # Data
 # ------------------------------------------------
-__all__ = ["LicenseAction"]
+__all__ = ["LicenseAction", "CachedFormatterParser"]
 
 
 # Classes
@@ -50,18 +51,59 @@ class LicenseAction(argparse.Action):
             default = default,
             nargs = 0,
             help = help)
-        self.license = license if license is not None else str()
-        self.license.strip()
+        self.license = (license or str()).strip()
         return None
 
     def __call__(self, parser, namespace, values, option_string=None):
         """
         Well, what LicenseAction does :)
         """
-        parser.exit(message=self.license)
+        parser.exit(message=self.license + "\n")
         return None
     
 
+class _Choices(frozenset):
+    """
+    A frozenset for the *choices* of an argument. Iterating over it
+    yields the sorted elements, so that help and error messages are
+    stable.
+    """
+
+    def __iter__(self):
+        return iter(sorted(super().__iter__()))
+
+    def __repr__(self):
+        return ", ".join(map(repr, self))
+
+    
+class CachedFormatterParser(argparse.ArgumentParser):
+    """
+    An argparse.ArgumentParser, that reuses one formatter to validate the
+    metavar in *add_argument()*, instead of creating a new one for each
+    argument.
+
+    The formatters used to create the usage and help messages are not
+    cached, because they are stateful.
+    """
+
+    _cached_formatter = None
+    _validating = False
+
+    def _get_formatter(self):
+        if not self._validating:
+            return super()._get_formatter()
+        if self._cached_formatter is None:
+            self._cached_formatter = super()._get_formatter()
+        return self._cached_formatter
+
+    def add_argument(self, *args, **kwargs):
+        self._validating = True
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            self._validating = False
+
+
 class ArgumentParser(object):
     """
     Wraps the argparse.ArgumentParser object, that is used by the application.
@@ -70,7 +112,7 @@ class ArgumentParser(object):
     def __init__(self, app):
         self._app = app
 
-        self.argparser = argparse.ArgumentParser(
+        self.argparser = CachedFormatterParser(
             description="Extendable Minecraft Server Manager (EMSM)",
             epilog=("Visit https://github.com/benediktschmitt/emsm for "
                     "further information."),
@@ -80,18 +122,104 @@ class ArgumentParser(object):
         # This subparser group contains the subparsers of all plugins.
         self.plugin_parsers = self.argparser.add_subparsers(
             title="plugin", dest="plugin",
-            description="The name of the plugin, you want to invoke."
+            description="The name of the plugin, you want to invoke.",
+            parser_class=CachedFormatterParser
             )
 
+        # Maps the names of all registered plugins to their argparser. The
+        # argparser is created when it is requested the first time.
+        self._plugin_argparsers = dict()
+
+        # The name of the plugin, that has been invoked per command line.
+        # None, if no plugin is invoked.
+        self._invoked_plugin = None
+
         # Contains all parsed arguents
-        self.args = None
+        self._args = None
         return None
 
+    def register_plugin(self, name):
+        """
+        Registers the name of a plugin. The argparser of the plugin is not
+        created until it is requested with *plugin_parser()*.
+        """
+        self._plugin_argparsers.setdefault(name, None)
+        return None
+
+    def resolve(self, argv=None):
+        """
+        Searches *argv* (default: *sys.argv[1:]*) for the first token, that
+        is the name of a registered plugin, and returns it. Values of the
+        global options, like *--world WORLD*, are skipped. If an option is
+        not known literally (e.g. the abbreviation *--wor*), the search
+        stops and no plugin is resolved, because we can not tell, if the
+        next token is its value.
+
+        Only the argparser of this plugin will be added to the subparsers.
+        If no plugin is invoked, all plugin argparsers are added, so that
+        they are listed in the help message.
+        """
+        if argv is None:
+            argv = sys.argv[1:]
+
+        self._invoked_plugin = None
+        skip_next = False
+        for token in argv:
+            if skip_next:
+                skip_next = False
+            elif token.startswith("-"):
+                action = self.argparser._option_string_actions.get(token)
+                if action is None:
+                    break
+                skip_next = action.nargs is None
+            elif token in self._plugin_argparsers:
+                self._invoked_plugin = token
+                break
+            else:
+                break
+        return self._invoked_plugin
+
+    def plugin_parser(self, name):
+        """
+        Returns the argparser of the plugin *name* and creates it, if
+        necessary.
+
+        Only the argparser of the invoked plugin is added to the subparsers
+        of the application. All other plugins receive a detached argparser,
+        which can still be used for *BasePlugin.embedded_run()*.
+        """
+        parser = self._plugin_argparsers.get(name)
+        if parser is None:
+            if self._invoked_plugin in (None, name):
+                parser = self.plugin_parsers.add_parser(name)
+            else:
+                parser = CachedFormatterParser(
+                    prog="{} {}".format(self.argparser.prog, name))
+            self._plugin_argparsers[name] = parser
+        return parser
+
+    @property
+    def args(self):
+        """
+        The parsed arguments. The command line is parsed on first access.
+        """
+        return self.parse_args()
+
     def parse_args(self):
         """
-        Parses all arguments and stores them in *self.args*.
+        Parses all arguments and stores them in *self.args*. The arguments
+        are only parsed once, until *invalidate()* is called.
+        """
+        if self._args is None:
+            self._args = self.argparser.parse_args()
+        return self._args
+
+    def invalidate(self):
+        """
+        Drops the parsed arguments, so that the next access of *self.args*
+        parses the command line again.
         """
-        self.args = self.argparser.parse_args()
+        self._args = None
         return None
 
     def add_app_args(self):
@@ -115,7 +243,7 @@ class ArgumentParser(object):
             action = "append",
             dest = "worlds",
             metavar = "WORLD",
-            choices = self._app.conf.worlds.sections(),
+            choices = _Choices(self._app.conf.worlds.sections()),
             default = list(),
             help = "Selects single worlds."
             )
@@ -134,7 +262,7 @@ class ArgumentParser(object):
             action = "append",
             dest = "server",
             metavar = "SERVER",
-            choices = self._app.conf.server.sections(),
+            choices = _Choices(self._app.conf.server.sections()),
             default = list(),
             help = "Selects single server software."
             )
@@ -29,7 +29,6 @@ import os
 import logging
 import shutil
 import argparse
-import subprocess
 
 # local
 from app_lib import userinput
@@ -52,8 +51,7 @@ class LongHelpAction(argparse.Action):
         if help is None:
             help = "Shows the manual and exists."
             
-        self.description = description if description is not None else str()
-        self.description.strip()
+        self.description = (description or str()).strip()
         
         super().__init__(
             option_strings = option_strings,
@@ -67,26 +65,11 @@ class LongHelpAction(argparse.Action):
         """
         Well, what LongHelpAction does :)
         """
-        # We print the docstring under linux with *less*, if available.
-        was_printed = False
-        try:
-            less_proc = subprocess.Popen("less", stdin=subprocess.PIPE)
-            try:
-                less_proc.stdin.write(self.description.encode())
-                was_printed = True
-            except IOError as err:
-                print(err)
-            finally:
-                less_proc.stdin.close()
-                less_proc.wait()
-        except (OSError, ValueError) as err:
-            pass
-
-        # Use the print command, if nothing else worked.
-        if not was_printed:
-            print(self.description)
-            was_printed = True
-            
+        # pydoc chooses a suitable pager (e.g. *less*) and falls back to
+        # a plain print, if no pager is available. It's imported here,
+        # because it's expensive to import and rarely needed.
+        import pydoc
+        pydoc.pager(self.description)
         parser.exit()
         return None
 
@@ -130,7 +113,8 @@ class BasePlugin(object):
             * self.log
             * self.conf
             * self.data_dir
-            * self.argparser
+            * self.argparser (created on first access, see
+              *init_argparser()*)
 
         Extend but do not overwrite.
         """
@@ -144,21 +128,48 @@ class BasePlugin(object):
             main_conf.add_section(name)
         self.conf = main_conf[name]
 
-        # Get the directories of the plugin.
+        # Get the directories of the plugin. The path is resolved and
+        # created only once, here.
         self.data_dir = app.paths.get_plugin_data_dir(name)
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
+        os.makedirs(self.data_dir, exist_ok=True)
 
         # Get the docstring of the plugin module.
         type(self).description = app.plugins.get_module(name).__doc__
 
-        # Create a new argparser for this plugin.
-        self.argparser = app.argparser.plugin_parsers.add_parser(name)
-        
-        self.argparser.add_argument(
-            "--long-help",
-            action = LongHelpAction,
-            description = self.description)
+        # The argparser of this plugin is created on first access.
+        self._argparser = None
+        return None
+
+    @property
+    def argparser(self):
+        """
+        The argparser of this plugin. It is created, when it is accessed
+        the first time. See *load_argparser()*.
+        """
+        return self.load_argparser()
+
+    def load_argparser(self):
+        """
+        Creates the argparser of this plugin, if not yet done, and returns
+        it. The plugin manager only loads the argparser of the invoked
+        plugin, or of all plugins, if no plugin is invoked.
+        """
+        if self._argparser is None:
+            self._argparser = self.app.argparser.plugin_parser(self.name)
+            self._argparser.add_argument(
+                "--long-help",
+                action = LongHelpAction,
+                description = self.description)
+            self.init_argparser()
+        return self._argparser
+
+    def init_argparser(self):
+        """
+        Called, when the argparser of the plugin has been created. Add the
+        arguments of the plugin to *self.argparser* here and not in
+        *__init__()*, so that the argparser is only set up, if it is
+        needed.
+        """
         return None
 
     def uninstall(self):
@@ -318,6 +318,13 @@ class PluginManager(object):
         When this method is called a second time, only the plugins
         that have not been initialised yet, will be initialised.
         """
+        # Find the invoked plugin, before the plugins create their
+        # argparsers.
+        argparser = self._app.argparser
+        for name in self._plugin_types:
+            argparser.register_plugin(name)
+        invoked_plugin = argparser.resolve()
+        
         init_queue = self._plugin_types.items()
         init_queue = sorted(init_queue, key=lambda e: e[1].init_priority)        
         for name, plugin_type in init_queue:
@@ -325,6 +332,13 @@ class PluginManager(object):
                 continue
             plugin_obj = plugin_type(self._app, name)
             self._plugins[name] = plugin_obj
+
+        # Set the argparser of the invoked plugin up. The argparsers of all
+        # other plugins are only created, if they are requested later.
+        # If no plugin is invoked, all argparsers are needed for the help.
+        for name, plugin_obj in self._plugins.items():
+            if invoked_plugin in (None, name):
+                plugin_obj.load_argparser()
         return None
     
     def run(self):
@@ -203,26 +203,58 @@ class BaseServerWrapper(object):
             )
         return cmd
 
-    def update(self, reporthook=None):
+    @property
+    def prefetch_path(self):
+        """The path, *prefetch()* downloads the server to."""
+        return self.server + ".new"
+
+    def prefetch(self, reporthook=None):
+        """
+        Downloads the server_jar into *self.prefetch_path* and returns
+        the path of the downloaded file. The current server file is not
+        touched, so the server may be online. If the download fails or is
+        interrupted, the partial file is removed.
+        reporthook is the reporthook of urllib.request.urlretrieve.
+
+        Raises: ServerUpdateFailure
+        """
+        filename = self.prefetch_path
+        try:
+            urllib.request.urlretrieve(
+                self.url,
+                filename,
+                reporthook=reporthook
+                )
+        except BaseException as error:
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
+            if isinstance(error, (OSError, urllib.error.URLError)):
+                raise ServerUpdateFailure(self)
+            raise
+        return filename
+
+    def update(self, reporthook=None, prefetched=None):
         """
-        Downloads the server_jar into a temporary file and copies the
-        file if the download succeeded to the server directory.
+        Downloads the server_jar with *prefetch()* and moves the file
+        into place, if the download succeeded.
         reporthook is the reporthook of urllib.request.urlretrieve.
 
+        If *prefetched* is the path returned by *prefetch()*, the download
+        is skipped and only the file is moved.
+
         Raises: ServerIsOnlineError, ServerUpdateFailure
         """
         if self.is_online():
             raise ServerIsOnlineError(self)
 
+        if prefetched is None:
+            prefetched = self.prefetch(reporthook)
         try:
-            temp_server_file, http_message = urllib.request.urlretrieve(
-                self.url,
-                reporthook=reporthook
-                )
-        except (OSError, urllib.error.URLError):
+            shutil.move(prefetched, self.server)
+        except OSError:
             raise ServerUpdateFailure(self)
-        else:
-            shutil.move(temp_server_file, self.server)
         return None    
 
     def uninstall(self):
@@ -286,22 +318,18 @@ class ServerWrapper(BaseServerWrapper):
         value is invalid, if the user changed the configuration options,
         associated with this server.
         """
-        worlds = self._app.worlds
-        running_worlds = worlds.get_by_pred(
-            lambda w: w.server is self and w.is_online()
-            )
+        running_worlds = self._app.worlds.get_online_for_server(self)
         return bool(running_worlds)
 
-    def update(self, reporthook=None):
+    def prefetch(self, reporthook=None):
         """
-        The same magic as in BaseServerWrapper.update(...), but this one will
-        print a pretty reporthook.
+        The same magic as in BaseServerWrapper.prefetch(...), but this one
+        will print a pretty reporthook.
         """
         if reporthook is None:
             reporthook = app_lib.downloadreporthook.Reporthook(
-                self.url, target=self.server)
-        BaseServerWrapper.update(self, reporthook)
-        return None
+                self.url, target=self.prefetch_path)
+        return BaseServerWrapper.prefetch(self, reporthook)
 
     def uninstall(self, replace_with):
         """
@@ -86,6 +86,18 @@ __all__ = ["WorldError", "WorldStatusError",
 _SCREEN = shlex.which("screen")
 
 
+# Functions
+# ------------------------------------------------
+def _screen_ls():
+    """
+    Returns the output of *screen -ls*.
+    """
+    # XXX: screen -ls seems to exit always the exit code 1
+    #   so it's convenient to use gestatusoutput.
+    status, output = subprocess.getstatusoutput("screen -ls")
+    return output
+
+
 # Exceptions
 # ------------------------------------------------
 class WorldError(Exception):
@@ -289,15 +301,16 @@ class BaseWorldWrapper(object):
     # screen
     # --------------------------------------------
     
-    def get_pids(self):
+    def get_pids(self, screen_ls=None):
         """
         Returns a list with the pids of the screen sessions named
         self.screen_name
+
+        *screen_ls* is the output of *screen -ls*. If None, it is
+        requested.
         """
-        # Get sessions
-        # XXX: screen -ls seems to exit always the exit code 1
-        #   so it's convenient to use gestatusoutput.
-        status, output = subprocess.getstatusoutput("screen -ls")
+        if screen_ls is None:
+            screen_ls = _screen_ls()
     
         # foo@bar:~$ screen -ls
         # There is a screen on:
@@ -306,7 +319,7 @@ class BaseWorldWrapper(object):
         
         # Filter PIDs
         pids = list()
-        for line in output.split("\n"):
+        for line in screen_ls.split("\n"):
             if self.screen_name not in line:
                 continue
             pid = line[:line.find(self.screen_name) - 1]
@@ -462,22 +475,13 @@ class BaseWorldWrapper(object):
         
         self.overwrite_properties(**init_properties)
 
-        # We need to change the cwd to the world's directory
-        # to before starting the server.
-        old_wd = os.getcwd()
-        os.chdir(self.directory)
-        try:
-            if os.path.samefile(os.getcwd(), self.directory):
-                sys_cmd = "{screen} -dmS {screen_name} {start_cmd}".format(
-                    screen=_SCREEN, screen_name = self.screen_name,
-                    start_cmd = server_start_cmd)
-                subprocess.call(shlex.split(sys_cmd))
-        finally:
-            # We may have not the rights to change back.
-            try:
-                os.chdir(old_wd)
-            except OSError:
-                pass
+        # The server has to be started in the world's directory. We pass
+        # it as cwd to the subprocess instead of changing the cwd of the
+        # EMSM, so that worlds can be started from different threads.
+        sys_cmd = "{screen} -dmS {screen_name} {start_cmd}".format(
+            screen=_SCREEN, screen_name = self.screen_name,
+            start_cmd = server_start_cmd)
+        subprocess.call(shlex.split(sys_cmd), cwd=self.directory)
                        
         if not self.is_online():
             raise WorldStartFailed(self)
@@ -684,6 +688,18 @@ class WorldManager(object):
         """
         return list(filter(func, self._worlds.values()))
 
+    def get_online_for_server(self, server):
+        """
+        Returns the worlds, that are powered by *server* and currently
+        online. *screen -ls* is only called once for all worlds.
+        """
+        worlds = self.get_by_pred(lambda w: w.server is server)
+        if not worlds:
+            return worlds
+        
+        screen_ls = _screen_ls()
+        return [world for world in worlds if world.get_pids(screen_ls)]
+
     def get_selected(self):
         """
         Returns all worlds that have been selected per command line argument.
@@ -884,7 +884,6 @@ class BackupManager(BasePlugin):
         BasePlugin.__init__(self, application, name)
 
         self.setup_conf()
-        self.setup_argparser()
         return None
 
     def setup_conf(self):
@@ -933,7 +932,7 @@ class BackupManager(BasePlugin):
         self.backup_dirs = [self.data_dir] + self.mirrors
         return None
 
-    def setup_argparser(self):
+    def init_argparser(self):
         self.argparser.description = (
             "This plugin provides methods to manage the backups of the worlds."
             )
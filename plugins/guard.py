@@ -210,8 +210,9 @@ class Guard(BasePlugin):
         self.conf["error_regex"] = self.error_regex
         self.conf["auto_run"] = "yes" if self.auto_run else "no"
         self.conf["guard_all_worlds"] = "yes" if self.guard_all_worlds else "no"
+        return None
 
-        # Argparser
+    def init_argparser(self):
         self.argparser.description = (
             "Watches the logfiles and checks if the worlds are running smooth.")
         return None
@@ -187,8 +187,13 @@ class HelloDolly(BasePlugin):
         if not os.path.exists(self.lyrics_file):
             with open(self.lyrics_file, "w") as file:
                 file.write(_DEFAULT_LYRICS)
+        return None
 
-        # Now, we set our argparser up.
+    def init_argparser(self):
+        """
+        The argparser is created, when it is needed the first time. Then,
+        this method is called and we can set our argparser up.
+        """
         self.argparser.description = (
             "Demonstrates the implementation of a plugin. Inspired by the "
             "wordpress plugin \"Hello, Dolly\"."
@@ -137,7 +137,6 @@ class InitD(BasePlugin):
         self.stop_occured = False
 
         self.setup_conf()
-        self.setup_argparser()
         return None
 
     def setup_conf(self):
@@ -146,7 +145,7 @@ class InitD(BasePlugin):
         self.conf["manage_all_worlds"] = "yes" if self.manage_all_worlds else "no"
         return None
     
-    def setup_argparser(self):
+    def init_argparser(self):
         self.argparser.description = (
             "Emits corresponding to the current runlevel diffrent event."
             "Make sure, that you copied the *emsm/initd_script* to "
@@ -324,8 +324,9 @@ class Plugins(BasePlugin):
     
     def __init__(self, app, name):
         BasePlugin.__init__(self, app, name)
+        return None
 
-        # Argparser
+    def init_argparser(self):
         self.argparser.description = (
             "This plugin provides methods to install or remove plugins from "
             "this application.")
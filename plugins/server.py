@@ -86,149 +86,190 @@ Select the server with the *common* arguments **--server** or **--all-server**.
 # Modules
 # ------------------------------------------------
 import os
+import sys
+import logging
+import concurrent.futures
 
 # local
 import world_wrapper
 import server_wrapper
 from base_plugin import BasePlugin
-from app_lib import downloadreporthook
 from app_lib import userinput
 
 
 # Data
 # ------------------------------------------------
 PLUGIN = "Server"
+log = logging.getLogger(__name__)
 
     
-# Classes
+# Functions
 # ------------------------------------------------
-class MyServer(object):
+def _report(level, msg, *args):
     """
-    Wraps an application server wrapper. :)
+    Prints the %-style message *msg* with the arguments *args*. If *level*
+    is not None, the message is also recorded in the log with this level.
+    The log formats the message lazily.
     """
+    print(msg % args)
+    if level is not None:
+        log.log(level, msg, *args)
+    return None
 
-    def __init__(self, app, server):
-        self.app = app
-        self.server = server
-        return None
 
-    def print_usage(self):
-        """
-        Returns true,
-        """
-        powered_worlds = [world \
-                          for world in self.app.worlds.get_all() \
-                          if world.server == self.server]
-
-        print("{} - usage:".format(self.server.name))
-        for world in powered_worlds:
-            print("\t", world.name)
-        return None
+def print_usage(app, server):
+    """
+    Returns true,
+    """
+    powered_worlds = [world \
+                      for world in app.worlds.get_all() \
+                      if world.server == server]
 
-    def print_configuration(self):
-        """
-        Prints the configuration of the server.
-        """
-        print("{} - configuration:".format(self.server.name))
-        for option in self.server.conf:
-            print("\t", option, "=", self.server.conf[option])
-        return None
+    print("{} - usage:".format(server.name))
+    for world in powered_worlds:
+        print("\t", world.name)
+    return None
 
-    def update(self, force_stop=True, stop_message=str()):
-        """
-        Updates the server.
 
-        Before the server will be updated, all worlds that are currently
-        online with this server, will be stopped.
-        """
-        print("{} - update: ...".format(self.server.name))
-        
-        # Get all worlds, that are currently running the server.
-        worlds = self.app.worlds.get_by_pred(
-            lambda w: w.server is self.server and w.is_online())
+def print_configuration(server):
+    """
+    Prints the configuration of the server.
+    """
+    lines = ["{} - configuration:".format(server.name)]
+    lines.extend("\t {} = {}".format(option, value) \
+                 for option, value in server.conf.items())
+    sys.stdout.write("\n".join(lines) + "\n")
+    return None
 
-        # Stop those worlds.
-        try:
-            for world in worlds:
-                print("{} - update: Stopping the world '{}' ..."\
-                      .format(self.server.name, world.name))
-                world.send_command("say {}".format(stop_message))
-                world.stop(force_stop)
-        # Do not continue if a world could not be stopped.
-        except world_wrapper.WorldStopFailed as error:
-            print("{} - update: failure: The world '{}' could not be stopped."\
-                  .format(self.server.name, error.world.name))
-        # Continue with the server update if all worlds are offline.
-        else:
-            reporthook = downloadreporthook.Reporthook(
-                url=self.server.url,
-                target=self.server.server
-                )
-            print("{} - update: Downloading the server ..."\
-                  .format(self.server.name))
-            try:
-                self.server.update(reporthook)
-            except server_wrapper.ServerUpdateFailure as error:
-                print("{} - update: failure: {}"\
-                      .format(self.server.name, error))
-            else:
-                print("{} - update: Download is complete."\
-                      .format(self.server.name))
-        # Restart the worlds.
-        finally:
-            for world in worlds:
-                try:
-                    world.start()
-                except world_wrapper.WorldIsOnlineError:
-                    pass
-                except world_wrapper.WorldStartFailed:
-                    print("{} - update: failure: The world '{} could not be "\
-                          "restarted.".format(self.server.name, world.name))
-                else:
-                    print("{} - update: The world '{}' has been restated."\
-                          .format(self.server.name, world.name))
+
+def update_server(app, server, force_stop=True, stop_message=str()):
+    """
+    Updates the server.
+
+    Before the server will be updated, all worlds that are currently
+    online with this server, will be stopped.
+    """
+    _report(None, "%s - update: ...", server.name)
+
+    # Download the server, while the worlds are still running. The
+    # server wrapper uses the download reporthook per default.
+    _report(None, "%s - update: Downloading the server ...", server.name)
+    try:
+        prefetched = server.prefetch()
+    except server_wrapper.ServerUpdateFailure as error:
+        _report(logging.ERROR, "%s - update: failure: %s", server.name, error)
+        return None
+    else:
+        _report(None, "%s - update: Download is complete.", server.name)
+    
+    # Get all worlds, that are currently running the server.
+    worlds = app.worlds.get_online_for_server(server)
+
+    # Stop those worlds. The worlds are stopped concurrently, because
+    # each stop waits for the world to save.
+    def stop_world(world):
+        _report(None, "%s - update: Stopping the world '%s' ...",
+                server.name, world.name)
+        world.send_command("say {}".format(stop_message))
+        world.stop(force_stop)
         return None
 
-    def uninstall(self):
-        """
-        Uninstalls the server.
-
-        Before the server will be uninstalled, there will be some checks to
-        make sure the server can be uninstalled without any side effects.
-        """
-        # We need a server that could replace this one.
-        avlb_server = self.app.server.get_names()
-        avlb_server.pop( avlb_server.index(self.server.name) )
-
-        # Break if there is no other server available.
-        if not avlb_server:
-            print("{} - uninstall: failure: There's no other server that "\
-                  "could replace this one.".format(self.server.name))
-            return None
-        
-        # Make sure, that the server should be removed.
-        question = "{} - uninstall: Are you sure, that you want to "\
-                   "uninstall the server? ".format(self.server.name)
-        if not userinput.ask(question):
-            return None
-        
-        # Get the name of the server that should replace this one.
-        replacement = userinput.get_value(
-            prompt=("{} - uninstall: Which server should replace this one?\n\t"
-                    "(Chose from: {}) ".format(self.server.name, avlb_server)),
-            check_func=lambda server: server in avlb_server,
-            )
-        replacement = self.app.server.get(replacement)        
-        
-        # Remove the server.
+    def start_world(world):
         try:
-            self.server.uninstall(replacement)
-        except server_wrapper.ServerIsOnlineError as error:
-            print("{} - uninstall: The server is still running. ",
-                  "\n\t'{}'".format(self.server.name, error))
+            world.start()
+        except world_wrapper.WorldIsOnlineError:
+            pass
+        except world_wrapper.WorldStartFailed:
+            _report(logging.ERROR, "%s - update: failure: The world '%s' "
+                    "could not be restarted.", server.name, world.name)
+        else:
+            _report(None, "%s - update: The world '%s' has been restated.",
+                    server.name, world.name)
         return None
 
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max(len(worlds), 1)) \
+             as executor:
+            try:
+                stop_failed = False
+                futures = [executor.submit(stop_world, world) \
+                           for world in worlds]
+                # All stops have to be finished, before any world is
+                # restarted.
+                concurrent.futures.wait(futures)
+                for future in futures:
+                    try:
+                        future.result()
+                    # Do not continue if a world could not be stopped.
+                    except world_wrapper.WorldError as error:
+                        _report(logging.ERROR, "%s - update: failure: The "
+                                "world '%s' could not be stopped.",
+                                server.name, error.world.name)
+                        stop_failed = True
+
+                # Replace the server if all worlds are offline.
+                if not stop_failed:
+                    try:
+                        server.update(prefetched=prefetched)
+                    except server_wrapper.ServerError as error:
+                        _report(logging.ERROR, "%s - update: failure: %s",
+                                server.name, error)
+                    else:
+                        _report(logging.INFO, "%s - update: The server has "
+                                "been replaced.", server.name)
+            # Restart the worlds.
+            finally:
+                list(executor.map(start_world, worlds))
+    finally:
+        # The prefetched file is still there, if the server has not been
+        # replaced.
+        if os.path.exists(prefetched):
+            os.remove(prefetched)
+    return None
+
+
+def uninstall_server(app, server):
+    """
+    Uninstalls the server.
+
+    Before the server will be uninstalled, there will be some checks to
+    make sure the server can be uninstalled without any side effects.
+    """
+    # We need a server that could replace this one.
+    avlb_server = [name for name in app.server.get_names() \
+                   if name != server.name]
+
+    # Break if there is no other server available.
+    if not avlb_server:
+        _report(logging.ERROR, "%s - uninstall: failure: There's no other "
+                "server that could replace this one.", server.name)
+        return None
+    
+    # Make sure, that the server should be removed.
+    question = "{} - uninstall: Are you sure, that you want to "\
+               "uninstall the server? ".format(server.name)
+    if not userinput.ask(question):
+        return None
     
+    # Get the name of the server that should replace this one.
+    replacement = userinput.get_value(
+        prompt=("{} - uninstall: Which server should replace this one?\n\t"
+                "(Chose from: {}) ".format(server.name, avlb_server)),
+        check_func=lambda name: name in avlb_server,
+        )
+    replacement = app.server.get(replacement)        
+    
+    # Remove the server.
+    try:
+        server.uninstall(replacement)
+    except server_wrapper.ServerIsOnlineError as error:
+        _report(logging.ERROR, "%s - uninstall: The server is still "
+                "running.\n\t'%s'", server.name, error)
+    return None
+
+
+# Classes
+# ------------------------------------------------
 class Server(BasePlugin):
     """
     Public interface for the server wrapper.    
@@ -240,7 +281,6 @@ class Server(BasePlugin):
         BasePlugin.__init__(self, application, name)
 
         self.setup_conf()
-        self.setup_argparser()
         return None
 
     def setup_conf(self):
@@ -250,21 +290,21 @@ class Server(BasePlugin):
         self.conf["update_message"] = self.update_message
         return None
 
-    def setup_argparser(self):
+    def init_argparser(self):
         self.argparser.description = (
             "This plugin provides methods to manage the server files "
             "and the server configuration.")
                 
         self.argparser.add_argument(
             "--configuration",
-            action = "count",
+            action = "store_true",
             dest = "conf",
             help = "Prints the configuration of the server."
             )
 
         self.argparser.add_argument(
             "--usage",
-            action = "count",
+            action = "store_true",
             dest = "usage",
             help = "Prints the names of the worlds, run by this server."
             )
@@ -272,41 +312,44 @@ class Server(BasePlugin):
         update_group = self.argparser.add_mutually_exclusive_group()
         update_group.add_argument(
             "--update",
-            action = "count",
+            action = "store_true",
             dest = "update",
             help = "Updates the selected server."
             )
         update_group.add_argument(
             "--force-update",
-            action = "count",
+            action = "store_true",
             dest = "force_update",
             help = "Forces the stop of a world before the update begins."
             )
         
         self.argparser.add_argument(
             "--uninstall",
-            action = "count",
+            action = "store_true",
             dest = "uninstall",
             help = "Removes the server."
             )
         return None
 
     def run(self, args):
+        # Nothing to do, if no action has been selected.
+        if not (args.conf or args.usage or args.update or args.force_update \
+                or args.uninstall):
+            return None
+        
         server = self.app.server.get_selected()
-        for s in server:            
-            s = MyServer(self.app, s)
-            
+        for s in server:
             if args.conf:
-                s.print_configuration()
+                print_configuration(s)
                 
             if args.usage:
-                s.print_usage()
+                print_usage(self.app, s)
 
             if args.update:
-                s.update(False, self.update_message)
+                update_server(self.app, s, False, self.update_message)
             elif args.force_update:
-                s.update(True, self.update_message)
+                update_server(self.app, s, True, self.update_message)
                 
             if args.uninstall:
-                s.uninstall()
+                uninstall_server(self.app, s)
         return None
@@ -247,7 +247,6 @@ class Status(BasePlugin):
         BasePlugin.__init__(self, application, name)
 
         self.setup_conf()
-        self.setup_argparser()
         return None
 
     def setup_conf(self):
@@ -281,7 +280,7 @@ class Status(BasePlugin):
         self.conf["json_path"] = self.json["path"]
         return None
 
-    def setup_argparser(self):
+    def init_argparser(self):
         self.argparser.add_argument(
             "--json",
             action="count",
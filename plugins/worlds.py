@@ -408,9 +408,7 @@ class Worlds(BasePlugin):
     def __init__(self, application, name):
         BasePlugin.__init__(self, application, name)
 
-        # Argumentparser
         self.setup_conf()
-        self.setup_argparser()
         return None
 
     def setup_conf(self):
@@ -429,7 +427,7 @@ class Worlds(BasePlugin):
         self.conf["send_command_timeout"] = str(self.default_send_command_timeout)
         return None
 
-    def setup_argparser(self):
+    def init_argparser(self):
         self.argparser.description = "This plugin provides methods to "\
                                      "manage the worlds."
 